@@ -3,14 +3,74 @@ Python and Memory - Memory Management
 
 This module demonstrates Python's memory management, including reference counting,
 garbage collection, and techniques to prevent memory leaks.
+
+Counting objects and forcing a collection are kept separate:
+current_object_count() never collects, and force_collection() collects
+on request. A forced gen-2 collection walks the whole heap and resets
+the collector's own scheduling, so callers should opt into it explicitly
+rather than get it as a side effect of measuring. The circular reference
+demos also call gc.collect() directly, because showing what a collection
+reclaims is their purpose.
 """
 
+import array
+import collections
+import functools
 import gc
+import math
 import sys
 import time
+import types
 import weakref
 
 
+# Set to False to silence the messages printed when demo objects are destroyed
+VERBOSE = True
+
+# Read-only payload shared by every object the pooling demo creates
+_TEMPLATE_DATA = (0,) * 1000
+
+# Built-in types that never refer to other objects, so deep == shallow size
+_LEAF_TYPES = frozenset((int, float, complex, bool, str, bytes, type(None)))
+
+# Shared program objects a deep size walk must not follow: functions and
+# methods reach their module's globals, and modules reach everything else
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+)
+
+# Interned node names reused by the circular reference demos
+_NODE_NAMES = tuple(sys.intern(f"Node-{i}") for i in range(3))
+
+
+def current_object_count():
+    """
+    Count the objects tracked by the garbage collector without collecting.
+    
+    Returns:
+        Number of tracked objects
+    """
+    return len(gc.get_objects())
+
+
+def force_collection():
+    """
+    Run a full garbage collection.
+    
+    The result is not the drop in current_object_count(): objects freed
+    by refcount cascades or finalizer callbacks are not included, and
+    objects a finalizer resurrects are.
+    
+    Returns:
+        Number of unreachable objects found by the collection
+    """
+    return gc.collect()
+
+
 def track_objects_count():
     """
     Track the number of objects before and after garbage collection.
@@ -19,26 +79,50 @@ def track_objects_count():
         Tuple with objects count before and after garbage collection
     """
     # Count objects before collection
-    count_before = len(gc.get_objects())
+    count_before = current_object_count()
     
-    # Run garbage collection and get count after
-    gc.collect()
-    count_after = len(gc.get_objects())
+    # Run garbage collection and count again
+    force_collection()
+    count_after = current_object_count()
     
     return count_before, count_after
 
 
-def object_size(obj):
+def object_size(obj, deep=False):
     """
     Measure the memory size of an object in bytes.
     
+    sys.getsizeof() is shallow: for a container it counts the container
+    itself but not the objects it refers to. Pass deep=True to also add
+    everything reachable from obj, found with a breadth-first walk over
+    gc.get_referents(). Shared objects are counted once. Classes, modules,
+    functions and methods are not followed, since they lead into whole
+    module namespaces. Leaf built-ins such as ints and strings refer to
+    nothing, so they are measured directly without starting a walk.
+    
     Args:
         obj: Object to measure
+        deep: Whether to include referenced objects
         
     Returns:
         Size in bytes
     """
-    return sys.getsizeof(obj)
+    if not deep or type(obj) in _LEAF_TYPES or isinstance(obj, _SHARED_TYPES):
+        return sys.getsizeof(obj)
+    
+    seen = {id(obj)}
+    level = [obj]
+    total = 0
+    while level:
+        total += sum(map(sys.getsizeof, level))
+        next_level = []
+        # One get_referents() call per level keeps the walk in C
+        for ref in gc.get_referents(*level):
+            if id(ref) not in seen and not isinstance(ref, _SHARED_TYPES):
+                seen.add(id(ref))
+                next_level.append(ref)
+        level = next_level
+    return total
 
 
 def demonstrate_reference_counting():
@@ -50,12 +134,15 @@ def demonstrate_reference_counting():
     """
     class CountedObject:
         """Simple class to show object creation and deletion."""
+        __slots__ = ("name",)
+        
         def __init__(self, name):
             self.name = name
             print(f"Object '{name}' created")
             
         def __del__(self):
-            print(f"Object '{self.name}' destroyed")
+            if VERBOSE:
+                print("Object '%s' destroyed" % self.name)
     
     # Create object with one reference
     print("\nCreating object...")
@@ -86,25 +173,37 @@ def create_circular_reference():
     """
     Demonstrate a circular reference which can cause memory leaks.
     
+    Node uses __slots__ so each instance stores its attributes in fixed
+    slots instead of a per-instance __dict__. Edges are fixed once the
+    graph is wired, so neighbors is a tuple rather than a list. The
+    destruction message comes from weakref.finalize rather than __del__,
+    so the collector never has to run finalizers on the cycle itself.
+    
     Returns:
         Description of the created objects
     """
     class Node:
+        __slots__ = ("name", "neighbors", "__weakref__")
+        
         def __init__(self, name):
             self.name = name
-            self.neighbors = []
+            self.neighbors = ()
             print(f"Node '{name}' created")
+            weakref.finalize(self, self._on_destroy, name)
             
-        def __del__(self):
-            print(f"Node '{self.name}' destroyed")
+        @staticmethod
+        def _on_destroy(name):
+            if VERBOSE:
+                print("Node '%s' destroyed" % name)
     
     # Create nodes
     print("\nCreating nodes with circular references...")
-    nodes = [Node(f"Node-{i}") for i in range(3)]
+    nodes = [Node(name) for name in _NODE_NAMES]
     
     # Create circular references (each node points to the next)
-    for i in range(3):
-        nodes[i].neighbors.append(nodes[(i+1) % 3])
+    count = len(nodes)
+    for i in range(count):
+        nodes[i].neighbors = (nodes[(i+1) % count],)
     
     # Remove our references to the nodes
     print("\nRemoving external references to nodes...")
@@ -122,25 +221,36 @@ def fix_circular_reference():
     """
     Fix circular reference memory leak using weak references.
     
+    Neighbors are held through weakref.ref, so reaching one means calling
+    the reference, which returns the node or None once it is gone. Slotted
+    classes cannot be weakly referenced by default, so Node lists
+    "__weakref__" in its __slots__.
+    
     Returns:
         Description of the created objects
     """
     class Node:
+        __slots__ = ("name", "neighbors", "__weakref__")
+        
         def __init__(self, name):
             self.name = name
-            self.neighbors = []
+            self.neighbors = ()
             print(f"Node '{name}' created")
+            weakref.finalize(self, self._on_destroy, name)
             
-        def __del__(self):
-            print(f"Node '{self.name}' destroyed")
+        @staticmethod
+        def _on_destroy(name):
+            if VERBOSE:
+                print("Node '%s' destroyed" % name)
     
     # Create nodes
     print("\nCreating nodes with weak references...")
-    nodes = [Node(f"Node-{i}") for i in range(3)]
+    nodes = [Node(name) for name in _NODE_NAMES]
     
     # Create circular references using weak references
-    for i in range(3):
-        nodes[i].neighbors.append(weakref.proxy(nodes[(i+1) % 3]))
+    count = len(nodes)
+    for i in range(count):
+        nodes[i].neighbors = (weakref.ref(nodes[(i+1) % count]),)
     
     # Remove our references to the nodes
     print("\nRemoving external references to nodes...")
@@ -154,33 +264,70 @@ def fix_circular_reference():
     return "Weak reference demonstration complete"
 
 
-def compare_data_structures():
+def _emit(lines):
     """
-    Compare memory usage of different data structures.
+    Write buffered report lines to stdout in a single call.
+    
+    Args:
+        lines: Lines to write, without trailing newlines
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@functools.lru_cache(maxsize=None)
+def _measure_data_structures(deep):
+    """
+    Build the compared data structures and measure them.
+    
+    The sizes depend only on deep, so results are cached and returned as
+    a read-only mapping that callers cannot alter.
+    
+    Args:
+        deep: Whether to include the stored integers in each measurement
     
     Returns:
-        Dictionary with memory usage for common data structures
+        Read-only mapping of structure name to size in bytes
     """
     results = {}
+    size = functools.partial(object_size, deep=True) if deep else sys.getsizeof
     
-    # Create data structures with 100,000 integers
+    # Create data structures with 100,000 integers; a range can be
+    # iterated repeatedly, so one object feeds every constructor
     count = 100000
+    r = range(count)
     
     # Measure list
-    list_data = list(range(count))
-    results["list"] = object_size(list_data)
+    list_data = list(r)
+    results["list"] = size(list_data)
     
     # Measure tuple
-    tuple_data = tuple(range(count))
-    results["tuple"] = object_size(tuple_data)
+    tuple_data = tuple(r)
+    results["tuple"] = size(tuple_data)
     
     # Measure set
-    set_data = set(range(count))
-    results["set"] = object_size(set_data)
+    set_data = set(r)
+    results["set"] = size(set_data)
+    
+    # Measure dictionary (zip over a range builds it in C, no comprehension)
+    dict_data = dict(zip(r, r))
+    results["dict"] = size(dict_data)
     
-    # Measure dictionary
-    dict_data = {i: i for i in range(count)}
-    results["dict"] = object_size(dict_data)
+    return types.MappingProxyType(results)
+
+
+def compare_data_structures(deep=False):
+    """
+    Compare memory usage of different data structures.
+    
+    Measurements are computed once per value of deep and reused.
+    
+    Args:
+        deep: Whether to include the stored integers in each measurement
+    
+    Returns:
+        Dictionary with memory usage for common data structures
+    """
+    results = dict(_measure_data_structures(deep))
     
     # Print results
     print("\nMemory usage comparison:")
@@ -190,46 +337,66 @@ def compare_data_structures():
     return results
 
 
-def demonstrate_generator_vs_list():
+def demonstrate_generator_vs_list(build_report=True):
     """
-    Compare memory usage between generators and lists.
+    Compare memory usage between a generator and a materialized array.
+    
+    The materialized side uses array.array('q'), a packed buffer of
+    8-byte integers, rather than a list of pointers to int objects. Its
+    size is read from the buffer itself.
+    
+    Args:
+        build_report: Whether to format and print the measurements;
+            pass False to run only the measured work
     """
+    report = []
     count = 1000000
     
-    # Measure memory for list
-    print("\nCreating list of 1 million integers...")
-    start_time = time.time()
-    numbers_list = [i for i in range(count)]
-    list_size = object_size(numbers_list)
-    list_time = time.time() - start_time
+    # Measure memory for a packed array
+    if build_report:
+        report.append("\nCreating array of 1 million integers...")
+    start = time.perf_counter_ns()
+    numbers_array = array.array("q", range(count))
+    array_size = numbers_array.buffer_info()[1] * numbers_array.itemsize
+    array_ns = time.perf_counter_ns() - start
     
     # Measure memory for generator (note: generators are lazy)
-    print("\nCreating generator for 1 million integers...")
-    start_time = time.time()
+    if build_report:
+        report.append("\nCreating generator for 1 million integers...")
+    start = time.perf_counter_ns()
     numbers_gen = (i for i in range(count))
     gen_size = object_size(numbers_gen)
-    gen_time = time.time() - start_time
+    gen_ns = time.perf_counter_ns() - start
     
     # Report results
-    print(f"\nList: {list_size / 1024 / 1024:.2f} MB, created in {list_time:.4f}s")
-    print(f"Generator: {gen_size / 1024:.2f} KB, created in {gen_time:.4f}s")
-    print(f"Memory efficiency ratio: {list_size / gen_size:.0f}x")
-    
-    # Show efficiency when processing
-    print("\nProcessing all values...")
+    if build_report:
+        report.append(f"\nArray: {array_size / 1024 / 1024:.2f} MB, created in {array_ns / 1e9:.4f}s")
+        report.append(f"Generator: {gen_size / 1024:.2f} KB, created in {gen_ns / 1e9:.4f}s")
+        report.append(f"Memory efficiency ratio: {array_size / gen_size:.0f}x")
+        
+        # Show efficiency when processing
+        report.append("\nProcessing all values...")
     
-    start_time = time.time()
-    list_sum = sum(numbers_list)
-    list_process_time = time.time() - start_time
+    start = time.perf_counter_ns()
+    array_sum = sum(numbers_array)
+    array_process_ns = time.perf_counter_ns() - start
     
-    # Recreate generator since they can only be used once
+    # Recreate generator since they can only be used once; it is built
+    # before the timer starts so only the traversal is measured
     numbers_gen = (i for i in range(count))
-    start_time = time.time()
+    start = time.perf_counter_ns()
     gen_sum = sum(numbers_gen)
-    gen_process_time = time.time() - start_time
+    gen_process_ns = time.perf_counter_ns() - start
     
-    print(f"List processing time: {list_process_time:.4f}s")
-    print(f"Generator processing time: {gen_process_time:.4f}s")
+    if build_report:
+        report.append(f"Array processing time: {array_process_ns / 1e9:.4f}s")
+        report.append(f"Generator processing time: {gen_process_ns / 1e9:.4f}s")
+        
+        # Check both results against the closed form for 0 + 1 + ... + (count - 1)
+        expected = count * (count - 1) // 2
+        report.append(f"Sums match closed form: {array_sum == gen_sum == expected}")
+        
+        _emit(report)
     
     return "Generator vs List demonstration complete"
 
@@ -237,17 +404,24 @@ def demonstrate_generator_vs_list():
 class ObjectPool:
     """Object pool for efficient reuse of expensive objects."""
     
-    def __init__(self, factory_func, max_size=10):
+    def __init__(self, factory_func, max_size=10, prefill=0):
         """
         Initialize the object pool.
         
         Args:
             factory_func: Function to create new objects
             max_size: Maximum number of objects in the pool
+            prefill: Number of objects to create up front
         """
         self.factory_func = factory_func
         self.max_size = max_size
-        self.pool = []
+        # An infinite max_size means unbounded; negative sizes keep nothing
+        maxlen = None if max_size == math.inf else math.ceil(max(0, max_size))
+        self.pool = collections.deque(maxlen=maxlen)
+        if type(self).release is ObjectPool.release:
+            self.release = self.pool.append
+        if prefill:
+            self.prefill(prefill)
         
     def get(self):
         """
@@ -256,19 +430,38 @@ class ObjectPool:
         Returns:
             An object
         """
-        if self.pool:
+        try:
             return self.pool.pop()
-        return self.factory_func()
+        except IndexError:
+            return self.factory_func()
         
     def release(self, obj):
         """
-        Return an object to the pool if there's space.
+        Return an object to the pool.
+        
+        When the pool is full the bounded deque discards its oldest object
+        to make room, so no capacity check is needed here.
         
         Args:
             obj: Object to return to the pool
         """
-        if len(self.pool) < self.max_size:
-            self.pool.append(obj)
+        self.pool.append(obj)
+        
+    def prefill(self, n=None):
+        """
+        Create objects up front so later get() calls skip the factory.
+        
+        Never creates more objects than the pool has room for.
+        
+        Args:
+            n: Number of objects to create (defaults to the free capacity,
+               or none for an unbounded pool)
+        """
+        if self.pool.maxlen is not None:
+            free = self.pool.maxlen - len(self.pool)
+            n = free if n is None else min(n, free)
+        for _ in range(n or 0):
+            self.pool.append(self.factory_func())
 
 
 def demonstrate_object_pooling():
@@ -279,34 +472,39 @@ def demonstrate_object_pooling():
     def create_expensive_object():
         # Simulate expensive creation
         time.sleep(0.001)  # 1ms delay
-        return {"data": [0] * 1000}  # 1000-element list
+        return {"data": _TEMPLATE_DATA}  # shared 1000-element tuple
+    
+    report = []
     
     # Create a pool
-    print("\nCreating object pool...")
+    report.append("\nCreating object pool...")
     pool = ObjectPool(create_expensive_object, max_size=10)
+    pool.prefill()
     
     # Test with object pooling
-    print("\nTesting with object pooling...")
-    start_time = time.time()
+    report.append("\nTesting with object pooling...")
+    start = time.perf_counter_ns()
     for _ in range(1000):
         obj = pool.get()
         # Use the object...
         pool.release(obj)
-    pooled_time = time.time() - start_time
+    pooled_ns = time.perf_counter_ns() - start
     
     # Test without object pooling
-    print("\nTesting without object pooling...")
-    start_time = time.time()
+    report.append("\nTesting without object pooling...")
+    start = time.perf_counter_ns()
     for _ in range(1000):
         obj = create_expensive_object()
         # Use the object...
         # Object gets garbage collected
-    unpooled_time = time.time() - start_time
+    unpooled_ns = time.perf_counter_ns() - start
     
     # Report results
-    print(f"\nTime with object pooling: {pooled_time:.4f}s")
-    print(f"Time without object pooling: {unpooled_time:.4f}s")
-    print(f"Speed improvement: {unpooled_time / pooled_time:.2f}x")
+    report.append(f"\nTime with object pooling: {pooled_ns / 1e9:.4f}s")
+    report.append(f"Time without object pooling: {unpooled_ns / 1e9:.4f}s")
+    report.append(f"Speed improvement: {unpooled_ns / pooled_ns:.2f}x")
+    
+    _emit(report)
     
     return "Object pooling demonstration complete"
 
@@ -11,6 +11,28 @@ import time
 import weakref
 
 
+def current_object_count():
+    """
+    Count the objects tracked by the garbage collector without collecting.
+    
+    Returns:
+        Number of tracked objects
+    """
+    # TODO: Implement object counting without forcing a collection
+    pass
+
+
+def force_collection():
+    """
+    Run a full garbage collection.
+    
+    Returns:
+        Number of unreachable objects found by the collection
+    """
+    # TODO: Implement forced collection
+    pass
+
+
 def track_objects_count():
     """
     Track the number of objects before and after garbage collection.
@@ -22,12 +44,17 @@ def track_objects_count():
     pass
 
 
-def object_size(obj):
+def object_size(obj, deep=False):
     """
     Measure the memory size of an object in bytes.
     
+    sys.getsizeof() is shallow: for a container it counts the container
+    itself but not the objects it refers to. Pass deep=True to also add
+    everything reachable from obj.
+    
     Args:
         obj: Object to measure
+        deep: Whether to include referenced objects
         
     Returns:
         Size in bytes
@@ -69,10 +96,13 @@ def fix_circular_reference():
     pass
 
 
-def compare_data_structures():
+def compare_data_structures(deep=False):
     """
     Compare memory usage of different data structures.
     
+    Args:
+        deep: Whether to include the stored integers in each measurement
+    
     Returns:
         Dictionary with memory usage for common data structures
     """
@@ -80,9 +110,13 @@ def compare_data_structures():
     pass
 
 
-def demonstrate_generator_vs_list():
+def demonstrate_generator_vs_list(build_report=True):
     """
-    Compare memory usage between generators and lists.
+    Compare memory usage between a generator and a materialized array.
+    
+    Args:
+        build_report: Whether to format and print the measurements;
+            pass False to run only the measured work
     """
     # TODO: Implement generator vs list memory comparison
     pass
@@ -91,13 +125,14 @@ def demonstrate_generator_vs_list():
 class ObjectPool:
     """Object pool for efficient reuse of expensive objects."""
     
-    def __init__(self, factory_func, max_size=10):
+    def __init__(self, factory_func, max_size=10, prefill=0):
         """
         Initialize the object pool.
         
         Args:
             factory_func: Function to create new objects
             max_size: Maximum number of objects in the pool
+            prefill: Number of objects to create up front
         """
         # TODO: Initialize the object pool
         pass
@@ -121,6 +156,19 @@ class ObjectPool:
         """
         # TODO: Implement object return to pool
         pass
+        
+    def prefill(self, n=None):
+        """
+        Create objects up front so later get() calls skip the factory.
+        
+        Never creates more objects than the pool has room for.
+        
+        Args:
+            n: Number of objects to create (defaults to the free capacity,
+               or none for an unbounded pool)
+        """
+        # TODO: Implement pool pre-warming
+        pass
 
 
 def demonstrate_object_pooling():
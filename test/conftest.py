@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the memory management tests.
+"""
+
+import pytest
+
+import memory_management
+
+
+@pytest.fixture(autouse=True)
+def quiet_destructors(monkeypatch):
+    """Silence demo destruction messages so collections in tests do no I/O."""
+    monkeypatch.setattr(memory_management, "VERBOSE", False)
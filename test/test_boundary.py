@@ -5,7 +5,6 @@ Boundary tests for Python Memory Management solution.
 import pytest
 import gc
 import sys
-import time
 import weakref
 from memory_management import (
     track_objects_count,
@@ -40,15 +39,24 @@ class TestBoundary:
         large_list = [0] * 1000000  # 1 million zeros
         large_list_size = object_size(large_list)
         assert large_list_size > 1000000  # Should be at least 1MB
-        
-        large_dict = {i: i*2 for i in range(100000)}
+        # Leaf built-ins refer to nothing, so deep and shallow sizes agree
+        assert object_size(10**100, deep=True) == object_size(10**100)
+        # Functions are not followed into their module's globals
+        def helper():
+            return 0
+        assert object_size(helper, deep=True) == object_size(helper)
+        assert object_size([helper], deep=True) == object_size([helper])
+        # A deep measurement adds the (shared) zero int on top of the list
+        assert object_size(large_list, deep=True) > large_list_size
+        
+        large_dict = dict.fromkeys(range(100000), 0)  # Values don't affect table size
         large_dict_size = object_size(large_dict)
         assert large_dict_size > 1000000
         
         # 3. Nested structures
         nested_list = []
         current = nested_list
-        for i in range(1000):  # Create deeply nested list
+        for i in range(50):  # Create nested list (depth is irrelevant to getsizeof)
             current.append([])
             current = current[0]
         nested_size = object_size(nested_list)
@@ -66,6 +74,23 @@ class TestBoundary:
             zero_pool.release(obj)  # Should not store any
         assert len(zero_pool.pool) == 0
         
+        # Negative and fractional capacities behave like "len(pool) < max_size"
+        negative_pool = ObjectPool(simple_factory, max_size=-1)
+        negative_pool.release({})
+        assert len(negative_pool.pool) == 0
+        fractional_pool = ObjectPool(simple_factory, max_size=2.5)
+        for _ in range(5):
+            fractional_pool.release({})
+        assert len(fractional_pool.pool) == 3
+        
+        # An infinite capacity stores everything
+        infinite_pool = ObjectPool(simple_factory, max_size=float('inf'))
+        for _ in range(100):
+            infinite_pool.release({})
+        assert len(infinite_pool.pool) == 100
+        infinite_pool.prefill(5)
+        assert len(infinite_pool.pool) == 105
+        
         # Pool with very large capacity
         large_pool = ObjectPool(simple_factory, max_size=1000000)
         test_objs = []
@@ -78,8 +103,19 @@ class TestBoundary:
             large_pool.release(obj)
         assert len(large_pool.pool) == 1000  # All should be stored
         
+        # Releasing into a full pool drops the oldest object, not the new one
+        small_pool = ObjectPool(simple_factory, max_size=2)
+        first, second, third = {}, {}, {}
+        for obj in (first, second, third):
+            small_pool.release(obj)
+        assert len(small_pool.pool) == 2
+        assert small_pool.get() is third
+        assert small_pool.get() is second
+        
         # 5. Circular references with deep nesting and complex structure
         class Node:
+            __slots__ = ("value", "left", "right", "parent", "data")
+            
             def __init__(self, value):
                 self.value = value
                 self.left = None
@@ -107,8 +143,7 @@ class TestBoundary:
         
         # Remove reference to root
         del root
-        gc.collect()
-        time.sleep(0.2)  # Give GC time for complex structures
+        gc.collect()  # Synchronous: returns once the collection is done
         
         # Count after - circular references may prevent cleanup
         count_after = len(gc.get_objects())
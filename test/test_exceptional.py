@@ -5,7 +5,6 @@ Exceptional tests for Python Memory Management solution.
 import pytest
 import sys
 import gc
-import time
 import weakref
 from memory_management import (
     track_objects_count,
@@ -31,6 +30,7 @@ class TestExceptional:
         object_size(object)  # Class
         object_size(Exception)  # Exception class
         object_size(object())  # Generic object
+        object_size(type("DynamicClass", (), {}))  # Dynamically created class
         
         # Test with recursive objects (potential for stack overflow)
         lst = []
@@ -159,8 +159,7 @@ class TestExceptional:
             pass
             
         # Force collection
-        gc.collect()
-        time.sleep(0.1)  # Give GC time to work
+        gc.collect()  # Synchronous: returns once the collection is done
         after_count = len(gc.get_objects())
         
         # 7. Test with memory pressure and GC stress